@@ -1,13 +1,24 @@
 import streamlit as st
 from typing import List, Dict, Optional, ClassVar
 from datetime import date
-import google.generativeai as genai
 import os
+import asyncio
+import threading
+import time
+import json
+import hashlib
+import csv
+import io
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+import pandas as pd
 
 from sqlmodel import Field, Session, SQLModel, create_engine, select
 from pydantic import BaseModel
-from sqlalchemy import exc
+from sqlalchemy import exc, delete, event, or_, update
+from sqlalchemy.orm import sessionmaker
+from tenacity import retry, retry_if_exception, wait_exponential, stop_after_attempt
 
 # Load environment variables (for GOOGLE_API_KEY)
 load_dotenv()
@@ -24,7 +35,7 @@ class TodoItem(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str
     description: Optional[str] = None
-    completed: bool = False
+    completed: bool = Field(default=False, index=True)
     priority: Optional[str] = Field(default=None, max_length=50)
     due_date: Optional[date] = Field(default=None)
     __table_args__ = {"extend_existing": True}
@@ -35,6 +46,15 @@ class TodoItem(SQLModel, table=True):
         arbitrary_types_allowed = True
 
 
+class TranslationCache(SQLModel, table=True):
+    __tablename__ = "translationcache"
+
+    todo_id: int = Field(primary_key=True, foreign_key="todoitem.id")
+    language: str = Field(primary_key=True)
+    translated_text: str
+    __table_args__ = {"extend_existing": True}
+
+
 class TodoItemCreate(BaseModel):
     title: str
     description: Optional[str] = None
@@ -48,18 +68,102 @@ class TodoItemUpdate(BaseModel):
     priority: Optional[str] = None
     due_date: Optional[date] = None
 
-# --- Gemini API Configuration ---
-try:
-    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-    if not GOOGLE_API_KEY:
-        st.error("GOOGLE_API_KEY not found in environment variables. Please set it as a Streamlit Secret.")
-        gemini_model = None
-    else:
-        genai.configure(api_key=GOOGLE_API_KEY)
-        gemini_model = genai.GenerativeModel('gemini-2.5-flash')
-except Exception as e:
-    st.error(f"Error configuring Google Gemini API: {e}")
-    gemini_model = None
+# --- Gemini API Configuration (Lazy, Cached) ---
+@st.cache_resource
+def get_gemini_model():
+    """
+    Imports and configures the Gemini client on first use and caches the model.
+    The SDK pulls in grpc and protobuf, so it is kept off the rerun path until a translation is requested.
+    Returns None when GOOGLE_API_KEY is not set.
+    """
+    import google.generativeai as genai
+
+    google_api_key = os.getenv("GOOGLE_API_KEY")
+    if not google_api_key:
+        return None
+    genai.configure(api_key=google_api_key)
+    return genai.GenerativeModel('gemini-2.5-flash')
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Checks for Gemini's quota error without importing the SDK up front."""
+    from google.api_core.exceptions import ResourceExhausted
+
+    return isinstance(error, ResourceExhausted)
+
+# --- Gemini Rate Limiting ---
+# Google AI default quota; requests over it return 429s and repeated overruns can get a project banned
+GEMINI_RPM_LIMIT = 60
+GEMINI_TPM_LIMIT = 100_000
+
+class SlidingWindowLimiter:
+    """
+    Client-side limiter enforcing requests-per-minute and tokens-per-minute over a sliding window.
+    Callers reserve an estimated token count before a request and record the actual usage after it.
+    """
+
+    def __init__(self, rpm: int, tpm: int, window_seconds: float = 60.0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window_seconds = window_seconds
+        self._requests = deque()
+        self._tokens = deque()
+        self._token_total = 0
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._token_total -= self._tokens.popleft()[1]
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        """Reserves capacity and returns 0, or returns how long to wait before trying again."""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            waits = [0.0]
+            if len(self._requests) >= self.rpm:
+                waits.append(self._requests[0] + self.window_seconds - now)
+            if self._tokens and self._token_total + estimated_tokens > self.tpm:
+                waits.append(self._tokens[0][0] + self.window_seconds - now)
+            wait = max(waits)
+            if wait <= 0:
+                self._requests.append(now)
+                self._tokens.append((now, estimated_tokens))
+                self._token_total += estimated_tokens
+            return max(wait, 0.0)
+
+    def acquire(self, estimated_tokens: int) -> None:
+        """Blocks until both windows have room for one request of the estimated size."""
+        while (wait := self._reserve(estimated_tokens)) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, estimated_tokens: int) -> None:
+        """Async variant of acquire that yields to the event loop while waiting."""
+        while (wait := self._reserve(estimated_tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def record(self, actual_tokens: Optional[int], estimated_tokens: int) -> None:
+        """Corrects the token window with the usage Gemini reported for a request."""
+        if actual_tokens is None:
+            return
+        with self._lock:
+            self._tokens.append((time.monotonic(), actual_tokens - estimated_tokens))
+            self._token_total += actual_tokens - estimated_tokens
+
+@st.cache_resource
+def get_gemini_limiter() -> SlidingWindowLimiter:
+    """Creates and caches one limiter shared by every session in this process."""
+    return SlidingWindowLimiter(rpm=GEMINI_RPM_LIMIT, tpm=GEMINI_TPM_LIMIT)
+
+def estimate_prompt_tokens(prompt: str) -> int:
+    """Roughly estimates prompt plus response tokens (about 4 characters per token)."""
+    return len(prompt) // 4 + 64
+
+def response_token_count(response) -> Optional[int]:
+    usage_metadata = getattr(response, "usage_metadata", None)
+    return getattr(usage_metadata, "total_token_count", None)
 
 # --- Database Engine Initialization and Table Creation (Cached) ---
 @st.cache_resource
@@ -68,9 +172,29 @@ def get_db_engine_and_create_tables():
     Initializes and caches the database engine, and creates tables.
     This function runs only once per Streamlit app session.
     """
-    engine = create_engine(DATABASE_URL, echo=False, connect_args={"check_same_thread": False})
+    engine = create_engine(
+        DATABASE_URL,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        # Larger compiled-statement cache than the default 500
+        query_cache_size=1200
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        # WAL batches fsyncs across commits and lets readers run alongside a writer
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
     try:
         SQLModel.metadata.create_all(engine)
+        # create_all skips tables that already exist, so add any indexes missing from older databases
+        for index in TodoItem.__table__.indexes:
+            index.create(engine, checkfirst=True)
         st.success("Database tables initialized (or already exist).")
     except Exception as e:
         st.error(f"Error during database initialization: {e}")
@@ -79,69 +203,417 @@ def get_db_engine_and_create_tables():
 # Get the cached database engine
 engine = get_db_engine_and_create_tables()
 
+@st.cache_resource
+def get_sessionmaker():
+    """
+    Creates and caches a session factory bound to the engine.
+    expire_on_commit=False keeps returned objects readable without a re-SELECT.
+    """
+    return sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+
+SessionLocal = get_sessionmaker()
+
 # --- Streamlit App Starts Here ---
 
 st.set_page_config(page_title="Streamlit To-Do App", layout="wide")
 st.title("Simple To-Do List")
 
-# Initialize session state for translations
+# Per-session LRU of translations keyed by (todo_id, language), in front of the SQLite cache
+TRANSLATION_SESSION_CACHE_SIZE = 200
 if 'translations' not in st.session_state:
-    st.session_state.translations = {}
+    st.session_state.translations = OrderedDict()
+
+# Background translation jobs keyed by (todo_ids, language), and errors they raised
+if 'pending_translations' not in st.session_state:
+    st.session_state.pending_translations = {}
+if 'translation_errors' not in st.session_state:
+    st.session_state.translation_errors = []
+
+# Row changes made by fragment callbacks since the last full rerun, keyed by todo_id
+if 'row_changes' not in st.session_state:
+    st.session_state.row_changes = {}
 
 # --- Database Operations ---
-# These functions now use the globally available and cached 'engine'
+# These functions use sessions from the globally available and cached 'SessionLocal' factory
 
-def get_all_todos_db() -> List[TodoItem]:
-    """Fetches all to-do items directly from the database."""
-    with Session(engine) as session:
-        todos = session.exec(select(TodoItem)).all()
-        return todos
+@st.cache_resource
+def get_all_todos_statement():
+    """
+    Builds the list query once per process. Streamlit re-executes module-level code on
+    every rerun, so the statement is cached here and reuses SQLAlchemy's compiled form.
+    """
+    return select(
+        TodoItem.id,
+        TodoItem.title,
+        TodoItem.description,
+        TodoItem.priority,
+        TodoItem.due_date,
+        TodoItem.completed
+    ).order_by(TodoItem.completed, TodoItem.id)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_all_todos_db() -> List[Dict]:
+    """
+    Fetches all to-do items from the database as plain dicts.
+    Cached so reruns that don't change data skip the query; writes clear it.
+    """
+    with SessionLocal() as session:
+        rows = session.exec(get_all_todos_statement()).all()
+        return [row._asdict() for row in rows]
 
 def create_todo_db(todo_create: TodoItemCreate) -> TodoItem:
     """Adds a new to-do item to the database."""
-    with Session(engine) as session:
+    with SessionLocal() as session:
         db_todo = TodoItem.model_validate(todo_create)
         session.add(db_todo)
         session.commit()
-        session.refresh(db_todo)
+        get_all_todos_db.clear()
         return db_todo
 
-def update_todo_db(todo_id: int, todo_update: TodoItemUpdate) -> Optional[TodoItem]:
-    """Updates a to-do item in the database."""
-    with Session(engine) as session:
-        todo = session.get(TodoItem, todo_id)
-        if not todo:
-            return None
-        update_data = todo_update.model_dump(exclude_unset=True)
-        todo.sqlmodel_update(update_data)
-        session.add(todo)
+# SQLite caps bound parameters per statement, so bulk inserts are flushed in chunks
+BULK_INSERT_CHUNK_SIZE = 500
+
+def create_todos_db(todo_creates: List[TodoItemCreate]) -> int:
+    """Adds many to-do items in a single transaction and returns how many were added."""
+    if not todo_creates:
+        return 0
+    with SessionLocal() as session:
+        for start in range(0, len(todo_creates), BULK_INSERT_CHUNK_SIZE):
+            chunk = todo_creates[start:start + BULK_INSERT_CHUNK_SIZE]
+            session.add_all([TodoItem.model_validate(item) for item in chunk])
+            session.flush()
         session.commit()
-        session.refresh(todo)
-        return todo
+        get_all_todos_db.clear()
+    return len(todo_creates)
+
+# Fields that make up the text sent to Gemini for translation
+TRANSLATED_FIELDS = ("title", "description", "priority", "due_date")
+
+def update_todo_db(todo_id: int, todo_update: TodoItemUpdate) -> bool:
+    """
+    Updates a to-do item with a single UPDATE statement, without loading it first.
+    Returns False when the item doesn't exist or already holds these values, in which case nothing is written.
+    """
+    update_data = todo_update.model_dump(exclude_unset=True)
+    if not update_data:
+        return False
+    with SessionLocal() as session:
+        statement = (
+            update(TodoItem)
+            .where(
+                TodoItem.id == todo_id,
+                # Only match the row if at least one value differs, so repeated clicks don't write
+                or_(*(getattr(TodoItem, field).is_distinct_from(value) for field, value in update_data.items()))
+            )
+            .values(**update_data)
+            .execution_options(synchronize_session=False)
+        )
+        result = session.exec(statement)
+        if result.rowcount == 0:
+            return False
+        # Cached translations are built from these fields, so drop them when one may have changed
+        if any(field in update_data for field in TRANSLATED_FIELDS):
+            session.exec(delete(TranslationCache).where(TranslationCache.todo_id == todo_id))
+        session.commit()
+        get_all_todos_db.clear()
+        return True
 
 def delete_todo_db(todo_id: int) -> bool:
     """Deletes a to-do item from the database."""
-    with Session(engine) as session:
+    with SessionLocal() as session:
         todo = session.get(TodoItem, todo_id)
         if not todo:
             return False
+        session.exec(delete(TranslationCache).where(TranslationCache.todo_id == todo_id))
         session.delete(todo)
         session.commit()
+        get_all_todos_db.clear()
         return True
 
+def delete_todos_db(todo_ids: List[int]) -> int:
+    """Deletes many to-do items in one statement and returns how many were removed."""
+    if not todo_ids:
+        return 0
+    with SessionLocal() as session:
+        session.exec(delete(TranslationCache).where(TranslationCache.todo_id.in_(todo_ids)))
+        result = session.exec(delete(TodoItem).where(TodoItem.id.in_(todo_ids)))
+        session.commit()
+        get_all_todos_db.clear()
+        return result.rowcount
+
+def get_cached_translations_db(todo_ids: List[int], language: str) -> Dict[int, str]:
+    """Fetches stored translations for the given to-do items and language."""
+    if not todo_ids:
+        return {}
+    with SessionLocal() as session:
+        rows = session.exec(
+            select(TranslationCache).where(
+                TranslationCache.language == language,
+                TranslationCache.todo_id.in_(todo_ids)
+            )
+        ).all()
+        return {row.todo_id: row.translated_text for row in rows}
+
+def save_translations_db(translations: Dict[int, str], language: str) -> None:
+    """Stores translations for the given to-do items and language."""
+    if not translations:
+        return
+    with SessionLocal() as session:
+        for todo_id, translated_text in translations.items():
+            session.merge(TranslationCache(todo_id=todo_id, language=language, translated_text=translated_text))
+        session.commit()
+
+def remember_translation(todo_id: int, language: str, translated_text: str) -> None:
+    """Stores a translation in the session LRU, evicting the oldest entries past the cap."""
+    session_translations = st.session_state.translations
+    session_translations[(todo_id, language)] = translated_text
+    session_translations.move_to_end((todo_id, language))
+    while len(session_translations) > TRANSLATION_SESSION_CACHE_SIZE:
+        session_translations.popitem(last=False)
+
+def forget_translations(todo_id: int) -> None:
+    """Drops every session translation for a to-do item."""
+    session_translations = st.session_state.translations
+    for key in [key for key in session_translations if key[0] == todo_id]:
+        del session_translations[key]
+
+def get_translations(todo_ids: List[int], language: str) -> Dict[int, str]:
+    """Looks up translations in the session LRU, falling back to the SQLite cache for misses."""
+    session_translations = st.session_state.translations
+    translations = {}
+    missing_ids = []
+    for todo_id in todo_ids:
+        key = (todo_id, language)
+        if key in session_translations:
+            session_translations.move_to_end(key)
+            translations[todo_id] = session_translations[key]
+        else:
+            missing_ids.append(todo_id)
+    for todo_id, translated_text in get_cached_translations_db(missing_ids, language).items():
+        remember_translation(todo_id, language, translated_text)
+        translations[todo_id] = translated_text
+    return translations
+
+def complete_todo(todo_id: int) -> None:
+    """Marks a to-do item completed and records it so its row redraws without a rerun."""
+    if st.session_state.row_changes.get(todo_id) == "completed":
+        return
+    update_todo_db(todo_id, TodoItemUpdate(completed=True))
+    st.session_state.row_changes[todo_id] = "completed"
+
+def delete_todo(todo_id: int) -> None:
+    """Deletes a to-do item, purges its session translations and records it so its row is cleared."""
+    delete_todo_db(todo_id)
+    forget_translations(todo_id)
+    st.session_state.row_changes[todo_id] = "deleted"
+
 # --- Translation Function ---
-def translate_text_gemini(text: str, target_language: str) -> Optional[str]:
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def translate_text_gemini_cached(text: str, target_language: str) -> str:
+    """Calls Gemini for a single translation. Raises on failure so errors are not cached."""
+    gemini_model = get_gemini_model()
     if not gemini_model:
-        st.error("Translation service not available. API key might be missing or invalid.")
-        return None
+        raise RuntimeError("Translation service not available. GOOGLE_API_KEY might be missing or invalid.")
+    prompt = f"Translate the following text into {target_language}: {text}"
+    limiter = get_gemini_limiter()
+    estimated_tokens = estimate_prompt_tokens(prompt)
+    limiter.acquire(estimated_tokens)
+    response = gemini_model.generate_content(prompt)
+    limiter.record(response_token_count(response), estimated_tokens)
+    return response.text
+
+def translate_text_gemini(text: str, target_language: str, todo_id: Optional[int] = None) -> Optional[str]:
+    """Translates text, reading through the SQLite cache when a to-do id is given."""
+    if todo_id is not None:
+        cached = get_cached_translations_db([todo_id], target_language)
+        if todo_id in cached:
+            return cached[todo_id]
     try:
-        prompt = f"Translate the following text into {target_language}: {text}"
-        response = gemini_model.generate_content(prompt)
-        translated_content = response.text
-        return translated_content
+        translated_content = translate_text_gemini_cached(text, target_language)
     except Exception as e:
         st.error(f"Gemini translation error: {e}")
         return None
+    if todo_id is not None:
+        save_translations_db({todo_id: translated_content}, target_language)
+    return translated_content
+
+# Process-wide translations keyed by a hash of (language, text), oldest dropped past this size
+TRANSLATION_MEMO_SIZE = 5000
+
+def translation_key(text: str, target_language: str) -> bytes:
+    """Hashes a (text, language) pair so identical prompts share one translation."""
+    return hashlib.blake2b(f"{target_language}\0{text}".encode(), digest_size=16).digest()
+
+@st.cache_resource
+def _tx_cache() -> Dict[bytes, str]:
+    """Creates the process-wide translation memo shared by every session and worker."""
+    return {}
+
+@st.cache_resource
+def _tx_cache_lock() -> threading.Lock:
+    return threading.Lock()
+
+def translate_texts_gemini(texts: List[str], target_language: str) -> List[str]:
+    """
+    Translates a list of texts, preserving order. Texts already in the process-wide memo,
+    and duplicates within the list, are only sent to Gemini once.
+    Raises on failure; it runs on a background worker, which cannot draw Streamlit errors itself.
+    """
+    keys = [translation_key(text, target_language) for text in texts]
+    memo = _tx_cache()
+    with _tx_cache_lock():
+        results = {key: memo[key] for key in keys if key in memo}
+    # dict.fromkeys drops duplicate texts while keeping their order
+    missing = dict.fromkeys((key, text) for key, text in zip(keys, texts) if key not in results)
+    if missing:
+        translated = _translate_texts_batch([text for _, text in missing], target_language)
+        with _tx_cache_lock():
+            for (key, _), translated_text in zip(missing, translated):
+                memo[key] = translated_text
+                results[key] = translated_text
+            while len(memo) > TRANSLATION_MEMO_SIZE:
+                del memo[next(iter(memo))]
+    return [results[key] for key in keys]
+
+def _translate_texts_batch(texts: List[str], target_language: str) -> List[str]:
+    """Translates a list of texts in a single Gemini request, preserving order."""
+    if not texts:
+        return []
+    gemini_model = get_gemini_model()
+    if not gemini_model:
+        raise RuntimeError("Translation service not available. GOOGLE_API_KEY might be missing or invalid.")
+    prompt = (
+        f"Translate this JSON array to {target_language}, "
+        "return a JSON array of equal length and order: " + json.dumps(texts)
+    )
+    limiter = get_gemini_limiter()
+    # The response is a JSON array of similar size to the input, so count the prompt twice
+    estimated_tokens = 2 * estimate_prompt_tokens(prompt)
+    # Retry once if the model returns a malformed or mismatched array
+    for _ in range(2):
+        limiter.acquire(estimated_tokens)
+        response = gemini_model.generate_content(
+            prompt,
+            generation_config={"response_mime_type": "application/json"}
+        )
+        limiter.record(response_token_count(response), estimated_tokens)
+        try:
+            translated = json.loads(response.text)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(translated, list) and len(translated) == len(texts):
+            return [str(item) for item in translated]
+    # The batch could not be matched back to the input, so translate each text concurrently instead
+    return asyncio.run(translate_texts_gemini_concurrent(texts, target_language))
+
+# Concurrent Gemini requests allowed at once, kept low for free-tier rate limits
+TRANSLATION_CONCURRENCY = 5
+
+@retry(
+    retry=retry_if_exception(is_rate_limit_error),
+    wait=wait_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(3),
+    reraise=True
+)
+async def _translate_one_async(text: str, target_language: str) -> str:
+    prompt = f"Translate the following text into {target_language}: {text}"
+    limiter = get_gemini_limiter()
+    estimated_tokens = estimate_prompt_tokens(prompt)
+    await limiter.acquire_async(estimated_tokens)
+    response = await get_gemini_model().generate_content_async(prompt)
+    limiter.record(response_token_count(response), estimated_tokens)
+    return response.text
+
+async def translate_texts_gemini_concurrent(texts: List[str], target_language: str) -> List[str]:
+    """Translates each text in its own Gemini request, running up to TRANSLATION_CONCURRENCY at once."""
+    semaphore = asyncio.Semaphore(TRANSLATION_CONCURRENCY)
+
+    async def translate_one(text: str) -> str:
+        async with semaphore:
+            return await _translate_one_async(text, target_language)
+
+    return list(await asyncio.gather(*(translate_one(text) for text in texts)))
+
+# --- Background Translation ---
+# Pending todos are split into batches of this size, each translated by its own worker
+TRANSLATION_BATCH_SIZE = 20
+TRANSLATION_WORKERS = 5
+
+@st.cache_resource
+def get_translation_executor() -> ThreadPoolExecutor:
+    """Creates and caches the worker pool that runs Gemini calls off the script thread."""
+    return ThreadPoolExecutor(max_workers=TRANSLATION_WORKERS, thread_name_prefix="translate")
+
+def translate_todos_job(todo_ids: List[int], texts: List[str], target_language: str) -> Dict[int, str]:
+    """Worker job: translates a batch of to-do texts and stores the results in the SQLite cache."""
+    translations = dict(zip(todo_ids, translate_texts_gemini(texts, target_language)))
+    save_translations_db(translations, target_language)
+    return translations
+
+def submit_translations(todos: List[Dict], target_language: str) -> None:
+    """Queues background translation of the given to-do items, skipping ones already in flight."""
+    pending = st.session_state.pending_translations
+    in_flight = {
+        todo_id
+        for todo_ids, language in pending
+        if language == target_language
+        for todo_id in todo_ids
+    }
+    todos = [todo for todo in todos if todo["id"] not in in_flight]
+    executor = get_translation_executor()
+    for start in range(0, len(todos), TRANSLATION_BATCH_SIZE):
+        batch = todos[start:start + TRANSLATION_BATCH_SIZE]
+        todo_ids = tuple(todo["id"] for todo in batch)
+        texts = [build_translation_text(todo) for todo in batch]
+        pending[(todo_ids, target_language)] = executor.submit(
+            translate_todos_job, list(todo_ids), texts, target_language
+        )
+
+@st.fragment(run_every=0.5)
+def poll_translations():
+    """Collects finished translation jobs and reruns the app once results are ready."""
+    pending = st.session_state.pending_translations
+    finished = [key for key, future in pending.items() if future.done()]
+    if not finished:
+        st.caption(f"Translating {sum(len(todo_ids) for todo_ids, _ in pending)} task(s)...")
+        return
+    for key in finished:
+        future = pending.pop(key)
+        _, language = key
+        try:
+            for todo_id, translated_text in future.result().items():
+                remember_translation(todo_id, language, translated_text)
+        except Exception as e:
+            st.session_state.translation_errors.append(f"Gemini translation error: {e}")
+    st.rerun()
+
+def build_translation_text(todo: Dict) -> str:
+    """Builds the text sent to Gemini for a to-do item."""
+    text_to_translate = todo["title"]
+    if todo["description"]:
+        text_to_translate += f" (Description: {todo['description']})"
+    if todo["priority"]:
+        text_to_translate += f" (Priority: {todo['priority']})"
+    if todo["due_date"]:
+        text_to_translate += f" (Due Date: {todo['due_date']})"
+    return text_to_translate
+
+# --- Import Helpers ---
+def parse_todo_import(file_name: str, content: bytes) -> List[TodoItemCreate]:
+    """Parses an uploaded CSV or JSON file into to-do items."""
+    text = content.decode("utf-8-sig")
+    if file_name.lower().endswith(".json"):
+        records = json.loads(text)
+        if not isinstance(records, list):
+            raise ValueError("JSON import must be a list of objects.")
+    else:
+        records = list(csv.DictReader(io.StringIO(text)))
+    todo_creates = []
+    for record in records:
+        # Treat blank CSV cells as missing values
+        cleaned = {key: value for key, value in record.items() if value not in ("", None)}
+        todo_creates.append(TodoItemCreate.model_validate(cleaned))
+    return todo_creates
 
 # --- Streamlit UI ---
 
@@ -164,6 +636,10 @@ selected_language_name = st.sidebar.selectbox(
     index=0
 )
 target_language = LANGUAGES[selected_language_name]
+translate_all_button = st.sidebar.button(f"Translate all pending to {selected_language_name}")
+for translation_error in st.session_state.translation_errors:
+    st.sidebar.error(translation_error)
+st.session_state.translation_errors = []
 
 
 # Add New To-Do Item
@@ -214,92 +690,167 @@ with st.form("add_todo_form", clear_on_submit=True):
         else:
             st.warning("Please enter a title for the To-Do item.")
 
+# Import To-Do Items
+with st.expander("Import To-Dos from CSV or JSON"):
+    uploaded_file = st.file_uploader(
+        "CSV with title, description, priority, due_date columns, or a JSON list of objects with those keys",
+        type=["csv", "json"],
+        key="import_todos_file"
+    )
+    if uploaded_file is not None and st.button("Import To-Dos"):
+        try:
+            imported_todos = parse_todo_import(uploaded_file.name, uploaded_file.getvalue())
+            imported_count = create_todos_db(imported_todos)
+            st.success(f"Imported {imported_count} To-Do item(s).")
+        except Exception as e:
+            st.error(f"Error importing todos: {e}")
+
 st.markdown("---")
 
+@st.cache_data(max_entries=1000, show_spinner=False)
+def _row_md(
+    task_number: int,
+    title: str,
+    description: Optional[str],
+    priority: Optional[str],
+    due_date: Optional[date],
+    completed: bool
+) -> str:
+    """Builds the markdown for a to-do row; cached so unchanged rows skip reformatting on rerun."""
+    if completed:
+        lines = [f"<del>**{task_number}. {title}**</del>"]
+        if description:
+            lines.append(f"<del>&nbsp;&nbsp;&nbsp;&nbsp;_{description}_</del>")
+        if priority:
+            lines.append(f"<del>&nbsp;&nbsp;&nbsp;&nbsp;**Priority:** {priority}</del>")
+        if due_date:
+            lines.append(f"<del>&nbsp;&nbsp;&nbsp;&nbsp;**Due:** {due_date}</del>")
+    else:
+        lines = [f"{task_number}. **{title}**"]
+        if description:
+            lines.append(f"&nbsp;&nbsp;&nbsp;&nbsp;_{description}_")
+        if priority:
+            lines.append(f"&nbsp;&nbsp;&nbsp;&nbsp;**Priority:** {priority}")
+        if due_date:
+            lines.append(f"&nbsp;&nbsp;&nbsp;&nbsp;**Due:** {due_date}")
+    # Blank lines keep each field in its own paragraph, as separate st.markdown calls did
+    return "\n\n".join(lines)
+
+@st.fragment
+def render_todo(todo: Dict, task_number: int, translated_text: Optional[str]):
+    """
+    Renders a single to-do row into its own placeholder as a fragment.
+    Button callbacks update the database and record the change, so the fragment
+    redraws just this placeholder without a full rerun or another SELECT.
+    """
+    row_slot = st.empty()
+    row_change = st.session_state.row_changes.get(todo["id"])
+    if row_change == "deleted":
+        row_slot.empty()
+        return
+    completed = todo["completed"] or row_change == "completed"
+
+    with row_slot.container():
+        with st.container(border=True):
+            row_md = _row_md(
+                task_number, todo["title"], todo["description"], todo["priority"], todo["due_date"], completed
+            )
+            if not completed:
+                col1, col2, col3 = st.columns([0.6, 0.3, 0.1])
+                with col1:
+                    st.markdown(row_md)
+                    if translated_text:
+                        st.markdown(f"**Translated ({selected_language_name}):** *{translated_text}*")
+
+                with col2:
+                    st.button("Mark Completed", key=f"complete_{todo['id']}", on_click=complete_todo, args=(todo["id"],))
+            else:
+                col1, col2, col3 = st.columns([0.7, 0.2, 0.1])
+                with col1:
+                    st.markdown(row_md, unsafe_allow_html=True)
+                    if translated_text:
+                        st.markdown(f"<del>**Translated ({selected_language_name}):** *{translated_text}*</del>", unsafe_allow_html=True)
+                with col2:
+                    pass
+            with col3:
+                st.button("Delete", key=f"delete_{todo['id']}", on_click=delete_todo, args=(todo["id"],))
+        st.divider()
+
+# Above this many pending tasks, render them as one editable table instead of a widget row per task
+LARGE_LIST_THRESHOLD = 50
+
+def render_pending_editor(pending_todos: List[Dict], translations: Dict[int, str]):
+    """Renders pending tasks in a single data editor with bulk complete and delete actions."""
+    df = pd.DataFrame(pending_todos)
+    if translations:
+        df[f"Translated ({selected_language_name})"] = df["id"].map(translations)
+    edited = st.data_editor(
+        df,
+        column_config={
+            "id": None,
+            "completed": st.column_config.CheckboxColumn("Mark completed")
+        },
+        disabled=[column for column in df.columns if column != "completed"],
+        hide_index=True,
+        num_rows="fixed",
+        key="pending_editor"
+    )
+    if st.button("Save completed tasks", key="save_pending_editor"):
+        newly_completed = edited[edited["completed"] != df["completed"]]
+        for todo_id in newly_completed["id"]:
+            update_todo_db(int(todo_id), TodoItemUpdate(completed=True))
+        st.rerun()
+
+    titles = {todo["id"]: todo["title"] for todo in pending_todos}
+    selected_ids = st.multiselect(
+        "Select tasks to delete",
+        list(titles),
+        format_func=titles.get,
+        key="pending_delete_selection"
+    )
+    if st.button("Delete selected", key="delete_pending_selection", disabled=not selected_ids):
+        delete_todos_db(selected_ids)
+        for todo_id in selected_ids:
+            forget_translations(todo_id)
+        st.rerun()
+
 # List Existing To-Do Items
 st.header("Your To-Do List")
 todos = get_all_todos_db()
 
+# A full rerun re-reads every row, so changes recorded by row fragments are no longer needed
+st.session_state.row_changes = {}
+
 if todos:
-    # Access attributes directly, not with .get()
-    incomplete_todos = [todo for todo in todos if not todo.completed]
-    completed_todos = [todo for todo in todos if todo.completed]
+    incomplete_todos, completed_todos = [], []
+    for todo in todos:
+        (completed_todos if todo["completed"] else incomplete_todos).append(todo)
+
+    # Translations come from the session LRU and SQLite cache, so reruns and new sessions do not hit Gemini
+    translations = get_translations([todo["id"] for todo in todos], target_language)
+
+    if translate_all_button:
+        submit_translations(
+            [todo for todo in incomplete_todos if todo["id"] not in translations],
+            target_language
+        )
 
     if incomplete_todos:
         st.subheader("Pending Tasks")
-        task_number = 1
-        for todo in incomplete_todos:
-            with st.container(border=True):
-                col1, col2, col3, col4 = st.columns([0.5, 0.2, 0.2, 0.1])
-                with col1:
-                    st.markdown(f"{task_number}. **{todo.title}**")
-                    if todo.description:
-                        st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;_{todo.description}_")
-                    if todo.priority:
-                        st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;**Priority:** {todo.priority}")
-                    if todo.due_date:
-                        st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;**Due:** {todo.due_date}")
-
-                    if todo.id in st.session_state.translations and \
-                       target_language in st.session_state.translations[todo.id]:
-                        st.markdown(f"**Translated ({selected_language_name}):** *{st.session_state.translations[todo.id][target_language]}*")
-
-                with col2:
-                    if st.button("Mark Completed", key=f"complete_{todo.id}"):
-                        update_todo_db(todo.id, TodoItemUpdate(completed=True))
-                        st.rerun()
-                with col3:
-                    if st.button(f"Translate to {selected_language_name}", key=f"translate_{todo.id}"):
-                        text_to_translate = todo.title
-                        if todo.description:
-                            text_to_translate += f" (Description: {todo.description})"
-                        if todo.priority:
-                            text_to_translate += f" (Priority: {todo.priority})"
-                        if todo.due_date:
-                            text_to_translate += f" (Due Date: {todo.due_date})"
-
-                        translated_text = translate_text_gemini(text_to_translate, target_language)
-                        if translated_text:
-                            if todo.id not in st.session_state.translations:
-                                st.session_state.translations[todo.id] = {}
-                            st.session_state.translations[todo.id][target_language] = translated_text
-                            st.rerun()
-                with col4:
-                    if st.button("Delete", key=f"delete_incomplete_{todo.id}"):
-                        delete_todo_db(todo.id)
-                        if todo.id in st.session_state.translations:
-                            del st.session_state.translations[todo.id]
-                        st.rerun()
-            st.divider()
-            task_number += 1
+        if len(incomplete_todos) > LARGE_LIST_THRESHOLD:
+            render_pending_editor(incomplete_todos, translations)
+        else:
+            for task_number, todo in enumerate(incomplete_todos, start=1):
+                render_todo(todo, task_number, translations.get(todo["id"]))
 
     if completed_todos:
         st.subheader("Completed Tasks")
-        completed_task_number = 1
-        for todo in completed_todos:
-            with st.container(border=True):
-                col1, col2, col3 = st.columns([0.7, 0.2, 0.1])
-                with col1:
-                    st.markdown(f"<del>**{completed_task_number}. {todo.title}**</del>", unsafe_allow_html=True)
-                    if todo.description:
-                        st.markdown(f"<del>&nbsp;&nbsp;&nbsp;&nbsp;_{todo.description}_</del>", unsafe_allow_html=True)
-                    if todo.priority:
-                        st.markdown(f"<del>&nbsp;&nbsp;&nbsp;&nbsp;**Priority:** {todo.priority}</del>", unsafe_allow_html=True)
-                    if todo.due_date:
-                        st.markdown(f"<del>&nbsp;&nbsp;&nbsp;&nbsp;**Due:** {todo.due_date}</del>", unsafe_allow_html=True)
-
-                    if todo.id in st.session_state.translations and \
-                       target_language in st.session_state.translations[todo.id]:
-                        st.markdown(f"<del>**Translated ({selected_language_name}):** *{st.session_state.translations[todo.id][target_language]}*</del>", unsafe_allow_html=True)
-                with col2:
-                    pass
-                with col3:
-                    if st.button("Delete", key=f"delete_completed_{todo.id}"):
-                        delete_todo_db(todo.id)
-                        if todo.id in st.session_state.translations:
-                            del st.session_state.translations[todo.id]
-                        st.rerun()
-            st.divider()
-            completed_task_number += 1
+        for task_number, todo in enumerate(completed_todos, start=1):
+            render_todo(todo, task_number, translations.get(todo["id"]))
 else:
     st.info("No To-Do items yet! Add one above.")
+
+# Poll in-flight translations without blocking the rest of the page; runs last so jobs submitted above are picked up
+if st.session_state.pending_translations:
+    with st.sidebar:
+        poll_translations()